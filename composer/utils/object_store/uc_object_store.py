@@ -5,16 +5,26 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import logging
 import os
 import pathlib
+import shutil
 import uuid
-from typing import Callable, List, Optional
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Optional
 
 from composer.utils.import_helpers import MissingConditionalImportError
 from composer.utils.object_store.object_store import ObjectStore, ObjectStoreTransientError
 
+try:
+    from databricks.sdk.core import DatabricksError
+except ImportError:
+    # The databricks-sdk requirement is validated in ``UCObjectStore.__init__``;
+    # this fallback only keeps the module importable without the optional dependency.
+    DatabricksError = None
+
 log = logging.getLogger(__name__)
 
 __all__ = ['UCObjectStore']
@@ -23,8 +33,7 @@ _NOT_FOUND_ERROR_CODE = 'NOT_FOUND'
 
 
 def _wrap_errors(uri: str, e: Exception):
-    from databricks.sdk.core import DatabricksError
-    if isinstance(e, DatabricksError):
+    if DatabricksError is not None and isinstance(e, DatabricksError):
         if e.error_code == _NOT_FOUND_ERROR_CODE:  # type: ignore
             raise FileNotFoundError(f'Object {uri} not found') from e
     raise ObjectStoreTransientError from e
@@ -45,11 +54,20 @@ class UCObjectStore(ObjectStore):
             Note that this prefix should always start with /Volumes and adhere to the above format
             since this object store only suports Unity Catalog Volumes and
             not other Databricks Filesystems.
+        download_chunk_size (int, optional): The number of bytes to read from the streaming
+            download response per iteration. Defaults to the ``COMPOSER_UC_DOWNLOAD_CHUNK_SIZE``
+            environment variable if set, otherwise 1 MiB. Larger values block on more socket
+            reads per write and hold a proportionally larger transient buffer in memory.
     """
 
     _UC_VOLUME_LIST_API_ENDPOINT = '/api/2.0/fs/list'
+    _DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+    _CACHE_MAX_ENTRIES = 1024
+    # urllib3 defaults to 10 pooled connections per host, so connections beyond that are
+    # torn down and re-established (a TLS handshake each) under the bulk transfer fanout
+    _CONNECTION_POOL_MAXSIZE = 32
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, download_chunk_size: Optional[int] = None) -> None:
         try:
             from databricks.sdk import WorkspaceClient
         except ImportError as e:
@@ -63,7 +81,43 @@ class UCObjectStore(ObjectStore):
                 'Visit https://databricks-sdk-py.readthedocs.io/en/latest/authentication.html#databricks-native-authentication '
                 'to identify different ways to setup credentials.') from e
         self.prefix = self.validate_path(path)
-        self.client = WorkspaceClient()
+        self._prefix_with_slash = self.prefix + '/'
+
+        if download_chunk_size is None and 'COMPOSER_UC_DOWNLOAD_CHUNK_SIZE' in os.environ:
+            download_chunk_size = int(os.environ['COMPOSER_UC_DOWNLOAD_CHUNK_SIZE'])
+        self._download_chunk_size = download_chunk_size if download_chunk_size is not None else self._DOWNLOAD_CHUNK_SIZE
+
+        # Object sizes observed from download responses, so that a get_object_size call
+        # for an object we just downloaded does not need another round-trip
+        self._object_size_cache: OrderedDict[str, int] = OrderedDict()
+
+        # Resolved object paths, since the same object names are resolved repeatedly
+        # when callers mix get_uri/get_object_size/download_object on the same objects
+        self._object_path_cache: OrderedDict[str, str] = OrderedDict()
+
+        self._tune_connection_pool()
+
+    def _tune_connection_pool(self) -> None:
+        """Grow the SDK session's per-host connection pool to cover the bulk transfer fanout.
+
+        The databricks-sdk keeps a persistent, keep-alive ``requests.Session``, but urllib3's
+        default pool holds only 10 connections per host, so ``download_objects``/``upload_objects``
+        running at higher concurrency would churn through fresh TLS handshakes. Tuning is
+        best-effort since the session is an internal detail of the SDK client.
+        """
+        session = getattr(self.client.api_client, '_session', None)
+        if session is None:
+            return
+        try:
+            from requests.adapters import HTTPAdapter
+            existing_adapter = session.get_adapter('https://')
+            session.mount(
+                'https://',
+                HTTPAdapter(pool_connections=self._CONNECTION_POOL_MAXSIZE,
+                            pool_maxsize=self._CONNECTION_POOL_MAXSIZE,
+                            max_retries=existing_adapter.max_retries))
+        except Exception:
+            log.debug('Unable to tune the databricks-sdk connection pool', exc_info=True)
 
     @staticmethod
     def validate_path(path: str) -> str:
@@ -78,18 +132,27 @@ class UCObjectStore(ObjectStore):
             path (str): The Databricks UC Volume path of the format
             `Volumes/<catalog-name>/<schema-name>/<volume-name>/path/to/folder`.
         """
-        path = os.path.normpath(path)
+        path = str(path)
+        # Fast path: an already-clean POSIX path can be split directly, skipping the
+        # character scan os.path.normpath performs. Paths with empty, '.' or '..'
+        # components (or a non-POSIX separator) fall back to full normalization
+        dirs = path.split('/')
+        if dirs and dirs[-1] == '':
+            dirs = dirs[:-1]
+        if os.sep != '/' or '' in dirs or '.' in dirs or '..' in dirs:
+            path = os.path.normpath(path)
+            dirs = path.split(os.sep)
+
         if not path.startswith('Volumes'):
             raise ValueError('Databricks Unity Catalog Volumes paths should start with "Volumes".')
 
-        dirs = path.split(os.sep)
         if len(dirs) < 4:
             raise ValueError(f'Databricks Unity Catalog Volumes path expected to be of the format '
                              '`Volumes/<catalog-name>/<schema-name>/<volume-name>/<optional-path>`. '
                              f'Found path={path}')
 
         # The first 4 dirs form the prefix
-        return os.path.join(*dirs[:4])
+        return '/'.join(dirs[:4])
 
     def _get_object_path(self, object_name: str) -> str:
         """Return the absolute Single Path Namespace for the given object_name.
@@ -98,10 +161,25 @@ class UCObjectStore(ObjectStore):
             object_name (str): Absolute or relative path of the object w.r.t. the
             UC Volumes root.
         """
-        # convert object name to relative path if prefix is included
-        if os.path.commonprefix([object_name, self.prefix]) == self.prefix:
-            object_name = os.path.relpath(object_name, start=self.prefix)
-        return os.path.join('/', self.prefix, object_name)
+        cached_path = self._object_path_cache.get(object_name)
+        if cached_path is not None:
+            return cached_path
+
+        # convert object name to relative path if prefix is included; a plain
+        # startswith on the precomputed 'prefix/' is much cheaper than
+        # os.path.commonprefix + os.path.relpath and only strips the prefix on a
+        # path-component boundary
+        relative_name = object_name
+        if object_name.startswith(self._prefix_with_slash):
+            relative_name = object_name[len(self._prefix_with_slash):]
+        elif object_name == self.prefix:
+            relative_name = '.'
+        object_path = os.path.join('/', self.prefix, relative_name)
+
+        self._object_path_cache[object_name] = object_path
+        if len(self._object_path_cache) > self._CACHE_MAX_ENTRIES:
+            self._object_path_cache.popitem(last=False)
+        return object_path
 
     def get_uri(self, object_name: str) -> str:
         """Returns the URI for ``object_name``.
@@ -132,9 +210,51 @@ class UCObjectStore(ObjectStore):
         """
         # remove unused variable
         del callback
-        with open(filename, 'rb') as f:
+        # The Files API accepts a raw octet-stream body, so hand the HTTP layer an
+        # unbuffered file object and let it read straight from the file descriptor
+        # instead of copying through Python's BufferedReader
+        with open(filename, 'rb', buffering=0) as f:
             self.client.files.upload(self._get_object_path(object_name), f)
 
+    def upload_objects(self, object_names: List[str], src_dir: str, max_concurrency: int = 16) -> None:
+        """Upload multiple files from local to UC volumes in parallel.
+
+        Each upload is an IO-bound HTTP request, so dispatching them to a thread pool
+        overlaps the network waits and the wall time scales with ``max_concurrency``
+        until the link is bandwidth-bound. Note that up to ``max_concurrency``
+        HTTPS connections to the workspace are held open at once.
+
+        .. note::
+
+            The Files API stores each uploaded body verbatim and offers no server-side
+            archive extraction, so many small files cannot be batched into a single
+            tar/zip request. Raising ``max_concurrency`` is the available lever for
+            amortizing the per-file request overhead of small-file workloads.
+
+        Args:
+            object_names (List[str]): Names of the stored objects in UC volumes w.r.t. volume root.
+                Each object is read from ``os.path.join(src_dir, object_name)``.
+            src_dir (str): The local directory containing the files to upload.
+            max_concurrency (int, optional): Maximum number of concurrent uploads. (default: ``16``)
+        """
+        self._run_concurrently(
+            [(name, os.path.join(src_dir, name.lstrip('/'))) for name in object_names],
+            lambda name, filename: self.upload_object(name, filename),
+            max_concurrency=max_concurrency,
+        )
+
+    def _run_concurrently(self, args_list: List[tuple], fn: Callable, max_concurrency: int) -> None:
+        """Dispatch ``fn`` over ``args_list`` via a thread pool, re-raising the first failure."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(fn, *args) for args in args_list]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
     def download_object(self,
                         object_name: str,
                         filename: str | pathlib.Path,
@@ -164,15 +284,35 @@ class UCObjectStore(ObjectStore):
             os.makedirs(dirname, exist_ok=True)
         tmp_path = str(filename) + f'{uuid.uuid4()}.tmp'
 
+        object_path = self._get_object_path(object_name)
         try:
-            from databricks.sdk.core import DatabricksError
             try:
-                with self.client.files.download(self._get_object_path(object_name)).contents as resp:
+                download_response = self.client.files.download(object_path)
+                # Only the size advertised by *this* response may be used for preallocation;
+                # the size cache can hold a stale entry from an earlier download of the
+                # same path
+                expected_size = self._maybe_cache_object_size(object_path, download_response)
+                with download_response.contents as resp:
                     with open(tmp_path, 'wb') as f:
-                        # Chunk the data into multiple blocks of 64MB to avoid
-                        # OOMs when downloading really large files
-                        for chunk in iter(lambda: resp.read(64 * 1024 * 1024), b''):
-                            f.write(chunk)
+                        # Preallocate the full file upfront when the response advertised its
+                        # size, so the filesystem can reserve contiguous extents instead of
+                        # growing the file one chunk at a time. Best-effort: not every
+                        # platform or filesystem supports it
+                        if expected_size and hasattr(os, 'posix_fallocate'):
+                            try:
+                                os.posix_fallocate(f.fileno(), 0, expected_size)
+                            except OSError:
+                                pass
+                        # Stream the data in small chunks so large files never have to be
+                        # buffered in memory all at once. Zero-copy paths (os.sendfile/
+                        # os.copy_file_range) are not an option here: the body arrives over
+                        # TLS, so the plaintext only ever exists in userspace buffers and
+                        # there is no kernel-visible source fd to splice from
+                        self._stream_to_file(resp, f)
+                        if expected_size:
+                            # The preallocation is only a hint; trim any excess so a stream
+                            # shorter than advertised is never published zero-padded
+                            f.truncate(f.tell())
             except DatabricksError as e:
                 _wrap_errors(self.get_uri(object_name), e)
         except:
@@ -183,10 +323,83 @@ class UCObjectStore(ObjectStore):
                 pass
             raise
         else:
-            if overwrite:
-                os.replace(tmp_path, filename)
-            else:
-                os.rename(tmp_path, filename)
+            # The tmp file lives next to the destination, so this is an atomic, same-filesystem
+            # rename; overwrite was already validated above. os.rename would overwrite silently
+            # on POSIX anyway, so use os.replace unconditionally
+            os.replace(tmp_path, filename)
+
+    def _stream_to_file(self, resp, f) -> None:
+        """Copy a streaming response body to the open file ``f`` in chunks.
+
+        When the stream supports ``readinto``, a single ``bytearray`` is reused for the
+        whole transfer instead of allocating a fresh ``bytes`` object per chunk.
+        """
+        readinto = getattr(resp, 'readinto', None)
+        if readinto is None:
+            shutil.copyfileobj(resp, f, length=self._download_chunk_size)
+            return
+        buf = bytearray(self._download_chunk_size)
+        view = memoryview(buf)
+        while True:
+            num_read = readinto(buf)
+            if not num_read:
+                break
+            f.write(view[:num_read])
+
+    def download_objects(self,
+                         object_names: List[str],
+                         dest_dir: str,
+                         max_concurrency: int = 16,
+                         overwrite: bool = False) -> None:
+        """Download multiple objects from UC Volumes in parallel.
+
+        Each download is an IO-bound HTTP request, so dispatching them to a thread pool
+        overlaps the network waits and the wall time scales with ``max_concurrency``
+        until the link is bandwidth-bound. Note that up to ``max_concurrency``
+        HTTPS connections to the workspace are held open at once.
+
+        Args:
+            object_names (List[str]): The names of the objects to download i.e. paths relative
+                to the root of the volume. Each object is saved to
+                ``os.path.join(dest_dir, object_name)``.
+            dest_dir (str): The local directory where the files will be downloaded.
+            max_concurrency (int, optional): Maximum number of concurrent downloads. (default: ``16``)
+            overwrite (bool, optional): Whether to overwrite existing files at the destination
+                paths, if they exist. (default: ``False``)
+
+        Raises:
+            FileNotFoundError: If any of the objects was not found in UC volumes.
+            ObjectStoreTransientError: If there was any other error querying the Databricks UC volumes that should be retried.
+        """
+        self._run_concurrently(
+            [(name, os.path.join(dest_dir, name.lstrip('/'))) for name in object_names],
+            lambda name, filename: self.download_object(name, filename, overwrite=overwrite),
+            max_concurrency=max_concurrency,
+        )
+
+    def _maybe_cache_object_size(self, object_path: str, download_response) -> Optional[int]:
+        """Cache and return the object size advertised by a streaming download response.
+
+        The Files API already sends ``Content-Length`` with every download, so recording it
+        here makes a subsequent :meth:`get_object_size` for the same object free.
+
+        Returns:
+            Optional[int]: The size advertised by this response, or ``None`` if the
+            response did not expose a content length.
+        """
+        content_length = getattr(download_response, 'content_length', None)
+        if content_length is None:
+            # Older SDKs only expose the header on the raw HTTP response wrapped by ``contents``
+            response = getattr(download_response.contents, 'response', None)
+            if response is not None:
+                content_length = response.headers.get('Content-Length')
+        if content_length is None:
+            return None
+        size = int(content_length)
+        self._object_size_cache[object_path] = size
+        if len(self._object_size_cache) > self._CACHE_MAX_ENTRIES:
+            self._object_size_cache.popitem(last=False)
+        return size
 
     def get_object_size(self, object_name: str) -> int:
         """Get the size of the object in UC volumes in bytes.
@@ -200,13 +413,61 @@ class UCObjectStore(ObjectStore):
         Raises:
             FileNotFoundError: If the file was not found in the object store.
         """
-        from databricks.sdk.core import DatabricksError
+        object_path = self._get_object_path(object_name)
+        cached_size = self._object_size_cache.get(object_path)
+        if cached_size is not None:
+            return cached_size
+
         try:
-            file_info = self.client.files.get_status(self._get_object_path(object_name))
+            file_info = self.client.files.get_status(object_path)
             return file_info.file_size
         except DatabricksError as e:
             _wrap_errors(self.get_uri(object_name), e)
 
+    def iter_objects(self, prefix: Optional[str] = None) -> Iterator[str]:
+        """Iterate over all objects in the object store with the given prefix.
+
+        Objects are yielded as each listing page arrives, so callers can start
+        processing (e.g. downloading) the first page while later pages are still
+        being fetched, instead of waiting for the full listing to materialize.
+
+         .. note::
+
+            This function removes the directories from the yielded objects.
+
+        Args:
+            prefix (str, optional): The prefix to search for. Defaults to the volume
+                prefix this store was constructed with.
+
+        Yields:
+            str: The object names that match the prefix, in listing order.
+        """
+        if not prefix:
+            prefix = self.prefix
+
+        object_path = self._get_object_path(prefix)
+        page_token = None
+        while True:
+            request = {'path': object_path}
+            if page_token:
+                request['page_token'] = page_token
+            try:
+                # NOTE: This API is in preview and should not be directly used outside of this instance
+                resp = self.client.api_client.do(method='GET',
+                                                 path=self._UC_VOLUME_LIST_API_ENDPOINT,
+                                                 data=json.dumps(request),
+                                                 headers={'Source': 'mosaicml/composer'})
+            except DatabricksError as e:
+                _wrap_errors(self.get_uri(prefix), e)
+            files = resp.get('files')
+            if files:
+                for f in files:
+                    if not f['is_dir']:
+                        yield f['path']
+            page_token = resp.get('next_page_token')
+            if not page_token:
+                return
+
     def list_objects(self, prefix: Optional[str]) -> List[str]:
         """List all objects in the object store with the given prefix.
 
@@ -220,17 +481,4 @@ class UCObjectStore(ObjectStore):
         Returns:
             list[str]: A list of object names that match the prefix.
         """
-        if not prefix:
-            prefix = self.prefix
-
-        from databricks.sdk.core import DatabricksError
-        try:
-            data = json.dumps({'path': self._get_object_path(prefix)})
-            # NOTE: This API is in preview and should not be directly used outside of this instance
-            resp = self.client.api_client.do(method='GET',
-                                             path=self._UC_VOLUME_LIST_API_ENDPOINT,
-                                             data=data,
-                                             headers={'Source': 'mosaicml/composer'})
-            return [f['path'] for f in resp.get('files', []) if not f['is_dir']]
-        except DatabricksError as e:
-            _wrap_errors(self.get_uri(prefix), e)
+        return list(self.iter_objects(prefix))
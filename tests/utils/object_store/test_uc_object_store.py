@@ -75,6 +75,33 @@ def test_uc_object_store_invalid_prefix(monkeypatch):
         UCObjectStore(path='Volumes/catalog/schema/')
 
 
+def test_uc_object_store_constructs_client_once(ws_client, monkeypatch):
+    db = pytest.importorskip('databricks.sdk', reason='requires databricks')
+
+    monkeypatch.setenv('DATABRICKS_HOST', 'test-host')
+    monkeypatch.setenv('DATABRICKS_TOKEN', 'test-token')
+    with mock.patch.object(db, 'WorkspaceClient', return_value=ws_client) as mock_client:
+        UCObjectStore(path='Volumes/catalog/schema/volume/path/')
+    mock_client.assert_called_once()
+
+
+def test_uc_object_store_download_chunk_size(ws_client, monkeypatch):
+    db = pytest.importorskip('databricks.sdk', reason='requires databricks')
+
+    monkeypatch.setenv('DATABRICKS_HOST', 'test-host')
+    monkeypatch.setenv('DATABRICKS_TOKEN', 'test-token')
+    with mock.patch.object(db, 'WorkspaceClient', lambda: ws_client):
+        uc = UCObjectStore(path='Volumes/catalog/schema/volume/')
+        assert uc._download_chunk_size == UCObjectStore._DOWNLOAD_CHUNK_SIZE
+
+        uc = UCObjectStore(path='Volumes/catalog/schema/volume/', download_chunk_size=4096)
+        assert uc._download_chunk_size == 4096
+
+        monkeypatch.setenv('COMPOSER_UC_DOWNLOAD_CHUNK_SIZE', '8192')
+        uc = UCObjectStore(path='Volumes/catalog/schema/volume/')
+        assert uc._download_chunk_size == 8192
+
+
 @pytest.mark.parametrize('result', ['success', 'not_found'])
 def test_get_object_size(ws_client, uc_object_store, result: str):
     if result == 'success':
@@ -91,6 +118,55 @@ def test_get_object_size(ws_client, uc_object_store, result: str):
         raise NotImplementedError(f'Test for result={result} is not implemented.')
 
 
+def test_get_object_size_cached_from_download(ws_client, uc_object_store, tmp_path):
+    db_files = pytest.importorskip('databricks.sdk.service.files')
+
+    file_content = bytes('0' * (100), 'utf-8')
+    file_to_download = str(tmp_path / Path('model.bin'))
+
+    def generate_dummy_file(_):
+        import io
+        resp = db_files.DownloadResponse(contents=io.BytesIO(file_content))
+        resp.content_length = len(file_content)
+        return resp
+
+    ws_client.files.download.side_effect = generate_dummy_file
+    uc_object_store.download_object('remote-model.bin', filename=file_to_download)
+
+    # The size observed during the download should be served without a get_status round-trip
+    assert uc_object_store.get_object_size('remote-model.bin') == len(file_content)
+    ws_client.files.get_status.assert_not_called()
+
+
+def test_download_object_shrunk_after_cached_size(ws_client, uc_object_store, tmp_path):
+    db_files = pytest.importorskip('databricks.sdk.service.files')
+
+    file_to_download = str(tmp_path / Path('model.bin'))
+    new_content = bytes('1' * (10), 'utf-8')
+
+    def generate_large_file(_):
+        import io
+        resp = db_files.DownloadResponse(contents=io.BytesIO(bytes('0' * (100), 'utf-8')))
+        resp.content_length = 100
+        return resp
+
+    def generate_small_file_without_length(_):
+        import io
+        return db_files.DownloadResponse(contents=io.BytesIO(new_content))
+
+    # The first download caches a 100-byte size for this path
+    ws_client.files.download.side_effect = generate_large_file
+    uc_object_store.download_object('remote-model.bin', filename=file_to_download)
+
+    # A re-download of a shrunk object without a content length must not be
+    # zero-padded out to the stale cached size by the preallocation
+    ws_client.files.download.side_effect = generate_small_file_without_length
+    uc_object_store.download_object('remote-model.bin', filename=file_to_download, overwrite=True)
+
+    with open(file_to_download, 'rb') as f:
+        assert f.read() == new_content
+
+
 def test_get_uri(uc_object_store):
     assert uc_object_store.get_uri('train.txt') == 'dbfs:/Volumes/catalog/schema/volume/train.txt'
     assert uc_object_store.get_uri('Volumes/catalog/schema/volume/checkpoint/model.bin'
@@ -106,6 +182,47 @@ def test_upload_object(ws_client, uc_object_store, tmp_path):
     ws_client.files.upload.assert_called_with('/Volumes/catalog/schema/volume/path/train.txt', ANY)
 
 
+def test_upload_objects(ws_client, uc_object_store, tmp_path):
+    object_names = ['path/train-0.txt', 'path/train-1.txt']
+    for object_name in object_names:
+        file_to_upload = tmp_path / Path(object_name)
+        file_to_upload.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_to_upload, 'wb') as f:
+            f.write(bytes(range(20)))
+
+    uc_object_store.upload_objects(object_names, src_dir=str(tmp_path))
+    ws_client.files.upload.assert_any_call('/Volumes/catalog/schema/volume/path/train-0.txt', ANY)
+    ws_client.files.upload.assert_any_call('/Volumes/catalog/schema/volume/path/train-1.txt', ANY)
+
+
+@pytest.mark.parametrize('result', ['success', 'not_found'])
+def test_download_objects(ws_client, uc_object_store, tmp_path, result: str):
+    db_files = pytest.importorskip('databricks.sdk.service.files')
+    object_names = ['remote-model-0.bin', 'remote-model-1.bin']
+
+    def generate_dummy_file(path):
+        import io
+        return db_files.DownloadResponse(contents=io.BytesIO(bytes(path, 'utf-8')))
+
+    if result == 'success':
+        ws_client.files.download.side_effect = generate_dummy_file
+        uc_object_store.download_objects(object_names, dest_dir=str(tmp_path))
+        for object_name in object_names:
+            ws_client.files.download.assert_any_call(f'/Volumes/catalog/schema/volume/{object_name}')
+            with open(tmp_path / Path(object_name), 'rb') as f:
+                assert f.read() == bytes(f'/Volumes/catalog/schema/volume/{object_name}', 'utf-8')
+
+    elif result == 'not_found':
+        db_core = pytest.importorskip('databricks.sdk.core', reason='requires databricks')
+        ws_client.files.download.side_effect = db_core.DatabricksError('The file being accessed is not found',
+                                                                       error_code='NOT_FOUND')
+        with pytest.raises(FileNotFoundError):
+            uc_object_store.download_objects(object_names, dest_dir=str(tmp_path))
+
+    else:
+        raise NotImplementedError(f'Test for result={result} is not implemented.')
+
+
 @pytest.mark.parametrize('result', ['success', 'file_exists', 'overwrite_file', 'not_found', 'error'])
 def test_download_object(ws_client, uc_object_store, tmp_path, result: str):
 
@@ -220,6 +337,66 @@ def test_list_objects(ws_client, uc_object_store, result):
         raise NotImplementedError(f'Test for result={result} is not implemented.')
 
 
+def test_list_objects_paginated(ws_client, uc_object_store):
+    prefix = 'Volumes/catalog/schema/volume/path/to/folder'
+    uc_list_api_responses = [{
+        'files': [{
+            'path': '/Volumes/catalog/volume/schema/path/to/folder/file1.txt',
+            'is_dir': False
+        }],
+        'next_page_token': 'token-1',
+    }, {
+        'files': [{
+            'path': '/Volumes/catalog/volume/schema/path/to/folder/file2.txt',
+            'is_dir': False
+        }],
+    }]
+
+    ws_client.api_client.do.side_effect = uc_list_api_responses
+    actual_files = uc_object_store.list_objects(prefix=prefix)
+
+    assert actual_files == [
+        '/Volumes/catalog/volume/schema/path/to/folder/file1.txt',
+        '/Volumes/catalog/volume/schema/path/to/folder/file2.txt',
+    ]
+    assert ws_client.api_client.do.call_count == 2
+    ws_client.api_client.do.assert_called_with(
+        method='GET',
+        path=uc_object_store._UC_VOLUME_LIST_API_ENDPOINT,
+        data='{"path": "/Volumes/catalog/schema/volume/path/to/folder", "page_token": "token-1"}',
+        headers={'Source': 'mosaicml/composer'})
+
+
+def test_iter_objects_streams_pages(ws_client, uc_object_store):
+    prefix = 'Volumes/catalog/schema/volume/path/to/folder'
+    uc_list_api_responses = [{
+        'files': [{
+            'path': '/Volumes/catalog/volume/schema/path/to/folder/file1.txt',
+            'is_dir': False
+        }],
+        'next_page_token': 'token-1',
+    }, {
+        'files': [{
+            'path': '/Volumes/catalog/volume/schema/path/to/folder/file2.txt',
+            'is_dir': False
+        }],
+    }]
+
+    ws_client.api_client.do.side_effect = uc_list_api_responses
+    object_iter = uc_object_store.iter_objects(prefix=prefix)
+
+    # The first page is yielded before the second page is requested, so callers
+    # can pipeline downloads with the listing
+    assert next(object_iter) == '/Volumes/catalog/volume/schema/path/to/folder/file1.txt'
+    assert ws_client.api_client.do.call_count == 1
+
+    assert next(object_iter) == '/Volumes/catalog/volume/schema/path/to/folder/file2.txt'
+    assert ws_client.api_client.do.call_count == 2
+
+    with pytest.raises(StopIteration):
+        next(object_iter)
+
+
 def test_uc_object_store_with_remote_ud(uc_object_store):
     uri = 'dbfs:/Volumes/path/to/my/folder/'
     rud = RemoteUploaderDownloader(bucket_uri=uri, backend_kwargs={'path': 'Volumes/catalog/schema/volume/path'})